@@ -17,9 +17,10 @@
 """
 Test Factory to make fake objects for testing
 """
+import itertools
 import factory
 from factory.fuzzy import FuzzyChoice, FuzzyDecimal
-from service.models import Product, Category
+from service.models import db, Product, Category
 
 
 class ProductFactory(factory.Factory):
@@ -59,3 +60,27 @@ class ProductFactory(factory.Factory):
             Category.TOOLS
         ]
     )
+
+
+# Seed factory-boy and Faker once so the generated products are repeatable
+factory.random.reseed_random(0)
+
+# Serialized products generated once at import and handed out in a cycle
+_PRODUCT_POOL = itertools.cycle([ProductFactory.build().serialize() for _ in range(256)])
+
+
+def build_products(count: int) -> list:
+    """Builds unsaved products from the pool of pre-generated data"""
+    return [Product().deserialize(data) for data in itertools.islice(_PRODUCT_POOL, count)]
+
+
+def create_products(count: int) -> list:
+    """Builds products from the pool and saves them in one transaction"""
+    products = build_products(count)
+    db.session.add_all(products)
+    db.session.flush()  # one batched INSERT that returns the new ids
+    # detach the products so the commit doesn't expire their attributes
+    for product in products:
+        db.session.expunge(product)
+    db.session.commit()
+    return products